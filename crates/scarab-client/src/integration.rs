@@ -54,6 +54,9 @@ struct ColorDumpOnce(bool);
 
 impl Plugin for IntegrationPlugin {
     fn build(&self, app: &mut App) {
+        #[cfg(target_os = "linux")]
+        app.add_systems(Startup, spawn_sequence_watcher);
+
         app.insert_resource(ColorDumpOnce::default())
             .add_systems(Startup, setup_terminal_rendering)
             .add_systems(
@@ -293,6 +296,56 @@ fn setup_terminal_rendering(
     info!("Terminal rendering pipeline initialized");
 }
 
+/// How long the sequence watcher sleeps before re-checking without a wake
+#[cfg(target_os = "linux")]
+const SEQUENCE_WAIT_TIMEOUT: std::time::Duration = std::time::Duration::from_millis(500);
+
+/// Spawn a background thread that wakes the event loop when the daemon publishes
+///
+/// The app runs in reactive low-power mode, so on its own new PTY output would
+/// only show up on the next input event or idle tick. The watcher blocks on the
+/// shared sequence number (woken by the daemon via futex) and sends a `WakeUp`
+/// event for each new frame, instead of the render loop polling for changes.
+#[cfg(target_os = "linux")]
+fn spawn_sequence_watcher(
+    state_reader: Res<SharedMemoryReader>,
+    event_loop_proxy: Option<Res<bevy::winit::EventLoopProxyWrapper<bevy::winit::WakeUp>>>,
+) {
+    // No winit event loop (e.g. headless tests) - nothing to wake
+    let Some(event_loop_proxy) = event_loop_proxy else {
+        return;
+    };
+    let proxy = (**event_loop_proxy).clone();
+    let shmem = SharedMemWrapper(Arc::clone(&state_reader.shmem.0));
+
+    if let Err(e) = std::thread::Builder::new()
+        .name("scarab-sequence-watcher".to_string())
+        .spawn(move || watch_sequence(shmem, move || proxy.send_event(bevy::winit::WakeUp).is_ok()))
+    {
+        warn!("Failed to spawn sequence watcher, relying on idle ticks: {e}");
+    }
+}
+
+/// Call `wake` for every newly published frame until it returns false
+#[cfg(target_os = "linux")]
+fn watch_sequence(shmem: SharedMemWrapper, mut wake: impl FnMut() -> bool) {
+    let state = SafeSharedState::from_shmem(&shmem.0);
+    let mut last_seen = state.sequence();
+
+    loop {
+        state.wait_for_sequence_change(last_seen, SEQUENCE_WAIT_TIMEOUT);
+
+        let current = state.sequence();
+        if current != last_seen {
+            last_seen = current;
+            if !wake() {
+                // Event loop has shut down
+                break;
+            }
+        }
+    }
+}
+
 /// Sync terminal state from shared memory
 fn sync_terminal_state_system(mut state_reader: ResMut<SharedMemoryReader>) {
     // Use safe wrapper to access shared state
@@ -467,6 +520,60 @@ mod tests {
         assert!(text.starts_with("Hi"));
     }
 
+    #[cfg(target_os = "linux")]
+    #[test]
+    fn test_watch_sequence_wakes_per_frame_until_stopped() {
+        use scarab_protocol::SharedState;
+        use shared_memory::ShmemConf;
+        use std::sync::atomic::{AtomicUsize, Ordering};
+        use std::time::{Duration, Instant};
+
+        let shmem = Arc::new(
+            ShmemConf::new()
+                .size(std::mem::size_of::<SharedState>())
+                .create()
+                .unwrap(),
+        );
+        let ptr = shmem.as_ptr() as *mut SharedState;
+
+        let wakes = Arc::new(AtomicUsize::new(0));
+        let watcher_wakes = Arc::clone(&wakes);
+        let wrapper = SharedMemWrapper(Arc::clone(&shmem));
+        let watcher = std::thread::spawn(move || {
+            watch_sequence(wrapper, move || {
+                // Stop after the third frame
+                watcher_wakes.fetch_add(1, Ordering::SeqCst) + 1 < 3
+            })
+        });
+
+        // Keep publishing frames (each waking the futex) until the watcher stops;
+        // wait for each wake so frames are not coalesced
+        let deadline = Instant::now() + Duration::from_secs(10);
+        let mut seq = 0;
+        while wakes.load(Ordering::SeqCst) < 3 {
+            assert!(Instant::now() < deadline, "watcher never woke");
+            let before = wakes.load(Ordering::SeqCst);
+            seq += 2;
+            unsafe {
+                (*ptr).begin_write(seq);
+                (*ptr).end_write(seq);
+                libc::syscall(
+                    libc::SYS_futex,
+                    (*ptr).sequence_wait_word(),
+                    libc::FUTEX_WAKE,
+                    i32::MAX,
+                );
+            }
+            let frame_deadline = Instant::now() + Duration::from_millis(200);
+            while wakes.load(Ordering::SeqCst) == before && Instant::now() < frame_deadline {
+                std::thread::sleep(Duration::from_millis(1));
+            }
+        }
+
+        watcher.join().unwrap();
+        assert_eq!(wakes.load(Ordering::SeqCst), 3);
+    }
+
     #[test]
     fn test_get_cell_at() {
         let mock = MockTerminalState::new(GRID_WIDTH, GRID_HEIGHT);
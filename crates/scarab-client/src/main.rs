@@ -81,6 +81,16 @@ fn main() {
         .os_id(&shmem_path)
         .open()
     {
+        Ok(m) if m.len() < std::mem::size_of::<SharedState>() => {
+            eprintln!(
+                "Shared memory at {} is {} bytes, expected at least {}",
+                shmem_path,
+                m.len(),
+                std::mem::size_of::<SharedState>()
+            );
+            eprintln!("Is the daemon running a different version of scarab?");
+            std::process::exit(1);
+        }
         Ok(m) => {
             println!("Connected to shared memory at: {}", shmem_path);
             Arc::new(m)
@@ -5,8 +5,9 @@
 //!
 //! ## Consistency Guarantees
 //!
-//! The daemon writes cells to shared memory and increments a sequence number.
-//! This module provides methods to detect if the sequence changed during a read:
+//! The daemon brackets every grid write with a seqlock: the sequence number is odd
+//! while a write is in progress and even once the frame is published.
+//! This module provides methods to detect a read that overlapped a write:
 //!
 //! - `try_read()` - Single attempt, returns None if sequence changed during read
 //! - `read_consistent()` - Retries until a consistent read succeeds
@@ -99,12 +100,40 @@ impl<'a> SafeSharedState<'a> {
         self.cursor_in_bounds()
     }
 
-    /// Read the sequence number using volatile/atomic semantics
+    /// Read the sequence number with Acquire ordering
     #[inline]
     fn read_sequence_atomic(&self) -> u64 {
-        let state = self.state_ref();
-        // Use volatile read to prevent compiler reordering
-        unsafe { std::ptr::read_volatile(&state.sequence_number) }
+        self.state_ref().load_sequence()
+    }
+
+    /// Block until a frame newer than `last_seen` is published or `timeout` elapses
+    ///
+    /// Sleeps on the sequence word as a futex, which the daemon wakes after each
+    /// published frame, so an idle terminal costs no CPU. Spurious wakeups are
+    /// possible; callers should re-check `sequence()` after this returns.
+    #[cfg(target_os = "linux")]
+    pub fn wait_for_sequence_change(&self, last_seen: u64, timeout: std::time::Duration) {
+        let current = self.read_sequence_atomic();
+        if current & !1 != last_seen {
+            return;
+        }
+
+        let timeout = libc::timespec {
+            tv_sec: timeout.as_secs() as libc::time_t,
+            tv_nsec: timeout.subsec_nanos() as libc::c_long,
+        };
+        // SAFETY: the wait word lies inside the live SharedState mapping. FUTEX_WAIT
+        // returns immediately if it no longer holds `current`, so a publish between
+        // the load above and the syscall is never missed.
+        unsafe {
+            libc::syscall(
+                libc::SYS_futex,
+                self.state_ref().sequence_wait_word(),
+                libc::FUTEX_WAIT,
+                current as u32,
+                &timeout as *const libc::timespec,
+            );
+        }
     }
 
     /// Read cells with consistency guarantee
@@ -124,24 +153,23 @@ impl<'a> SafeSharedState<'a> {
         let mut attempts = 0u32;
 
         loop {
-            // Step 1: Read sequence before
+            // Step 1: Read sequence before (odd means the daemon is mid-write)
             let seq_before = self.read_sequence_atomic();
 
-            // Step 2: Memory barrier to ensure we see current data
-            std::sync::atomic::fence(Ordering::Acquire);
+            if seq_before & 1 == 0 {
+                // Step 2: Read data
+                let state = self.state_ref();
+                let cells = state.cells.to_vec();
 
-            // Step 3: Read data
-            let state = self.state_ref();
-            let cells = state.cells.to_vec();
+                // Step 3: Memory barrier before re-reading sequence
+                std::sync::atomic::fence(Ordering::Acquire);
 
-            // Step 4: Memory barrier before re-reading sequence
-            std::sync::atomic::fence(Ordering::Acquire);
-
-            // Step 5: Verify sequence unchanged
-            let seq_after = self.read_sequence_atomic();
-            if seq_before == seq_after {
-                // Success - consistent read!
-                return Some((seq_before, cells));
+                // Step 4: Verify sequence unchanged
+                let seq_after = self.read_sequence_atomic();
+                if seq_before == seq_after {
+                    // Success - consistent read!
+                    return Some((seq_before, cells));
+                }
             }
 
             // Sequence changed during read - retry
@@ -162,17 +190,17 @@ impl<'a> SafeSharedState<'a> {
         loop {
             let seq_before = self.read_sequence_atomic();
 
-            std::sync::atomic::fence(Ordering::Acquire);
-
-            let state = self.state_ref();
-            let cursor_x = state.cursor_x;
-            let cursor_y = state.cursor_y;
+            if seq_before & 1 == 0 {
+                let state = self.state_ref();
+                let cursor_x = state.cursor_x;
+                let cursor_y = state.cursor_y;
 
-            std::sync::atomic::fence(Ordering::Acquire);
+                std::sync::atomic::fence(Ordering::Acquire);
 
-            let seq_after = self.read_sequence_atomic();
-            if seq_before == seq_after {
-                return Some((seq_before, cursor_x, cursor_y));
+                let seq_after = self.read_sequence_atomic();
+                if seq_before == seq_after {
+                    return Some((seq_before, cursor_x, cursor_y));
+                }
             }
 
             std::hint::spin_loop();
@@ -183,14 +211,15 @@ impl<'a> SafeSharedState<'a> {
         }
     }
 
-    /// Try to read cells without blocking, returning None if sequence changed during read
+    /// Try to read cells without blocking, returning None if a write overlapped the read
     ///
     /// This is useful for render loops where you'd rather skip a frame than block.
     /// Unlike `read_consistent`, this does NOT retry - it returns immediately.
     pub fn try_read(&self) -> Option<(u64, &[Cell])> {
         let seq_before = self.read_sequence_atomic();
-
-        std::sync::atomic::fence(Ordering::Acquire);
+        if seq_before & 1 != 0 {
+            return None; // Write in progress
+        }
 
         let state = self.state_ref();
         let cells = &state.cells[..];
@@ -228,8 +257,9 @@ impl<'a> TerminalStateReader for SafeSharedState<'a> {
     }
 
     fn sequence(&self) -> u64 {
-        let state = self.state_ref();
-        state.sequence_number
+        // While a write is in progress report the last published (even) sequence,
+        // so change detection only fires once the frame is complete.
+        self.read_sequence_atomic() & !1
     }
 
     fn is_valid(&self) -> bool {
@@ -406,6 +436,140 @@ impl TerminalStateReader for MockTerminalState {
 mod tests {
     use super::*;
 
+    /// Heap-allocated SharedState plus a raw pointer shared by the test's
+    /// writer and reader sides
+    fn shared_state() -> (Box<SharedState>, *mut SharedState) {
+        let mut state = Box::new(unsafe { std::mem::zeroed::<SharedState>() });
+        let ptr = &mut *state as *mut SharedState;
+        (state, ptr)
+    }
+
+    #[test]
+    fn test_try_read_rejects_write_in_progress() {
+        let (_state, ptr) = shared_state();
+        let reader = unsafe { SafeSharedState::from_ptr(ptr) };
+
+        unsafe { (*ptr).begin_write(2) };
+        assert!(reader.try_read().is_none());
+
+        unsafe { (*ptr).end_write(2) };
+        let (seq, cells) = reader
+            .try_read()
+            .expect("published frame should be readable");
+        assert_eq!(seq, 2);
+        assert_eq!(cells.len(), GRID_WIDTH * GRID_HEIGHT);
+    }
+
+    #[test]
+    fn test_read_consistent_skips_odd_sequence() {
+        let (_state, ptr) = shared_state();
+        let reader = unsafe { SafeSharedState::from_ptr(ptr) };
+
+        unsafe { (*ptr).begin_write(2) };
+        assert!(reader.read_consistent(3).is_none());
+
+        unsafe {
+            (*ptr).cells[0].char_codepoint = 'A' as u32;
+            (*ptr).end_write(2);
+        }
+        let (seq, cells) = reader
+            .read_consistent(3)
+            .expect("published frame should be readable");
+        assert_eq!(seq, 2);
+        assert_eq!(cells[0].char_codepoint, 'A' as u32);
+    }
+
+    #[test]
+    fn test_read_cursor_consistent_skips_odd_sequence() {
+        let (_state, ptr) = shared_state();
+        let reader = unsafe { SafeSharedState::from_ptr(ptr) };
+
+        unsafe {
+            (*ptr).begin_write(2);
+            (*ptr).cursor_x = 7;
+            (*ptr).cursor_y = 3;
+        }
+        assert!(reader.read_cursor_consistent(3).is_none());
+
+        unsafe { (*ptr).end_write(2) };
+        assert_eq!(reader.read_cursor_consistent(3), Some((2, 7, 3)));
+    }
+
+    #[test]
+    fn test_sequence_masks_in_progress_bit() {
+        let (_state, ptr) = shared_state();
+        let reader = unsafe { SafeSharedState::from_ptr(ptr) };
+
+        unsafe {
+            (*ptr).begin_write(2);
+            (*ptr).end_write(2);
+        }
+        assert_eq!(reader.sequence(), 2);
+
+        // While the next frame is being written, report the last published one
+        unsafe { (*ptr).begin_write(4) };
+        assert_eq!(reader.sequence(), 2);
+
+        unsafe { (*ptr).end_write(4) };
+        assert_eq!(reader.sequence(), 4);
+    }
+
+    /// Publish frame `seq` and wake futex waiters, as the daemon does
+    #[cfg(target_os = "linux")]
+    fn publish_and_wake(ptr: *mut SharedState, seq: u64) {
+        unsafe {
+            (*ptr).begin_write(seq);
+            (*ptr).end_write(seq);
+            libc::syscall(
+                libc::SYS_futex,
+                (*ptr).sequence_wait_word(),
+                libc::FUTEX_WAKE,
+                i32::MAX,
+            );
+        }
+    }
+
+    #[cfg(target_os = "linux")]
+    #[test]
+    fn test_wait_for_sequence_change_returns_when_already_moved() {
+        let (_state, ptr) = shared_state();
+        let reader = unsafe { SafeSharedState::from_ptr(ptr) };
+        unsafe {
+            (*ptr).begin_write(4);
+            (*ptr).end_write(4);
+        }
+
+        let start = std::time::Instant::now();
+        reader.wait_for_sequence_change(2, std::time::Duration::from_secs(10));
+        assert!(start.elapsed() < std::time::Duration::from_secs(1));
+    }
+
+    #[cfg(target_os = "linux")]
+    #[test]
+    fn test_wait_for_sequence_change_released_by_wake() {
+        let (_state, ptr) = shared_state();
+        unsafe {
+            (*ptr).begin_write(2);
+            (*ptr).end_write(2);
+        }
+
+        let addr = ptr as usize;
+        let waiter = std::thread::spawn(move || {
+            let reader = unsafe { SafeSharedState::from_ptr(addr as *const SharedState) };
+            let start = std::time::Instant::now();
+            reader.wait_for_sequence_change(2, std::time::Duration::from_secs(10));
+            (start.elapsed(), reader.sequence())
+        });
+
+        // Give the waiter time to block on the futex before publishing
+        std::thread::sleep(std::time::Duration::from_millis(100));
+        publish_and_wake(ptr, 4);
+
+        let (elapsed, seen) = waiter.join().unwrap();
+        assert!(elapsed < std::time::Duration::from_secs(5));
+        assert_eq!(seen, 4);
+    }
+
     #[test]
     fn test_mock_creation() {
         let mock = MockTerminalState::new(80, 24);
@@ -266,11 +266,12 @@ impl MockSharedState {
 
         SharedState {
             sequence_number: self.sequence_number,
+            _seq_padding: [0; 56],
             dirty_flag: 1,
             error_mode: 0,
             cursor_x: self.cursor_x,
             cursor_y: self.cursor_y,
-            _padding2: [0; 2],
+            _padding2: [0; 58],
             cells,
         }
     }
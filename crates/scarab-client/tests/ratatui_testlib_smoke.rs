@@ -10,7 +10,7 @@
 //! 1. Spawn scarab-daemon (headless)
 //! 2. Connect to /tmp/scarab-daemon.sock
 //! 3. Send ControlMessage::Input via IPC
-//! 4. Read /scarab_shm_v1 via TerminalStateReader
+//! 4. Read /scarab_shm_v2 via TerminalStateReader
 //! 5. Assert sequence number changes and text appears in the grid
 //!
 //! ## Environment Variable Gate
@@ -5,9 +5,11 @@ use crate::session::{
 };
 use anyhow::{Context, Result};
 use portable_pty::PtySize;
+use rkyv::de::deserializers::SharedDeserializeMap;
+use rkyv::Deserialize;
 use scarab_protocol::{
-    ControlMessage, DaemonMessage, MenuActionType, PluginInspectorInfo, SemanticZone, MAX_CLIENTS,
-    MAX_MESSAGE_SIZE, SOCKET_PATH,
+    ArchivedControlMessage, ControlMessage, DaemonMessage, MenuActionType, PluginInspectorInfo,
+    SemanticZone, MAX_CLIENTS, MAX_MESSAGE_SIZE, SOCKET_PATH,
 };
 use std::collections::HashMap;
 use std::path::Path;
@@ -303,8 +305,27 @@ async fn handle_client(
             .await
             .context("Failed to read message data")?;
 
-        // Deserialize with rkyv
-        let msg = match rkyv::from_bytes::<ControlMessage>(&buffer[..len]) {
+        // Validate the archived message in place (zero-copy access)
+        let archived = match rkyv::check_archived_root::<ControlMessage>(&buffer[..len]) {
+            Ok(archived) => archived,
+            Err(e) => {
+                log::warn!("Failed to validate ControlMessage: {:?}", e);
+                anyhow::bail!("Deserialization error");
+            }
+        };
+
+        // Fast path for keystrokes, which never need deserializing
+        match forward_archived_input(archived, &pty_handle).await {
+            Ok(true) => continue,
+            Ok(false) => {}
+            Err(e) => {
+                // Don't disconnect on individual message errors
+                log::warn!("Client {} message handling error: {}", client_id, e);
+                continue;
+            }
+        }
+
+        let msg: ControlMessage = match archived.deserialize(&mut SharedDeserializeMap::new()) {
             Ok(msg) => msg,
             Err(e) => {
                 log::warn!("Failed to deserialize ControlMessage: {:?}", e);
@@ -333,6 +354,27 @@ async fn handle_client(
 }
 
 /// Process a control message
+/// Forward an archived `Input` message to the PTY channel
+///
+/// Keystrokes are copied straight from the validated archive, skipping
+/// deserialization and the session/tab/pane dispatch chain (each of which would
+/// clone the message). The payload is bounded by the `MAX_MESSAGE_SIZE` frame
+/// check in `handle_client`.
+///
+/// Returns `Ok(false)` for every other message so the caller can dispatch it.
+async fn forward_archived_input(
+    archived: &ArchivedControlMessage,
+    pty_handle: &PtyHandle,
+) -> Result<bool> {
+    match archived {
+        ArchivedControlMessage::Input { data } => {
+            pty_handle.write_input(data.as_slice()).await?;
+            Ok(true)
+        }
+        _ => Ok(false),
+    }
+}
+
 async fn handle_message(
     msg: ControlMessage,
     pty_handle: &PtyHandle,
@@ -413,12 +455,9 @@ async fn handle_message(
             log::info!("Client {} resize: {}x{}", client_id, cols, rows);
             pty_handle.resize(cols, rows).await?;
         }
-        ControlMessage::Input { data } => {
-            // Validate input size to prevent abuse
-            if data.len() > MAX_MESSAGE_SIZE {
-                anyhow::bail!("Input data too large: {} bytes", data.len());
-            }
-            pty_handle.write_input(&data).await?;
+        // Keystrokes - forwarded from the archived buffer in handle_client
+        ControlMessage::Input { .. } => {
+            // Already handled by forward_archived_input
         }
         ControlMessage::LoadPlugin { path } => {
             log::info!("Client {} loading plugin: {}", client_id, path);
@@ -1234,3 +1273,40 @@ impl Drop for IpcServer {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn test_pty_handle() -> (PtyHandle, mpsc::Receiver<Vec<u8>>) {
+        let (input_tx, input_rx) = mpsc::channel(4);
+        let (resize_tx, _resize_rx) = mpsc::channel(1);
+        (PtyHandle::new(input_tx, resize_tx), input_rx)
+    }
+
+    #[tokio::test]
+    async fn test_forward_archived_input_sends_payload() {
+        let (pty_handle, mut input_rx) = test_pty_handle();
+        let msg = ControlMessage::Input {
+            data: b"ls -la\r\x1b[A".to_vec(),
+        };
+        let bytes = rkyv::to_bytes::<_, MAX_MESSAGE_SIZE>(&msg).unwrap();
+
+        let archived = rkyv::check_archived_root::<ControlMessage>(&bytes[..]).unwrap();
+        assert!(forward_archived_input(archived, &pty_handle).await.unwrap());
+
+        assert_eq!(input_rx.try_recv().unwrap(), b"ls -la\r\x1b[A");
+        assert!(input_rx.try_recv().is_err());
+    }
+
+    #[tokio::test]
+    async fn test_forward_archived_input_ignores_other_messages() {
+        let (pty_handle, mut input_rx) = test_pty_handle();
+        let msg = ControlMessage::Resize { cols: 80, rows: 24 };
+        let bytes = rkyv::to_bytes::<_, MAX_MESSAGE_SIZE>(&msg).unwrap();
+
+        let archived = rkyv::check_archived_root::<ControlMessage>(&bytes[..]).unwrap();
+        assert!(!forward_archived_input(archived, &pty_handle).await.unwrap());
+        assert!(input_rx.try_recv().is_err());
+    }
+}
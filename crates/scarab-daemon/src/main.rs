@@ -2,8 +2,8 @@ use anyhow::Result;
 use portable_pty::PtySize;
 use scarab_config::ConfigLoader;
 use scarab_protocol::{
-    SharedImageBuffer, SharedImagePlacement, SharedState, IMAGE_SHMEM_PATH, IMAGE_SHMEM_PATH_ENV,
-    MAX_IMAGES, SHMEM_PATH, SHMEM_PATH_ENV,
+    Cell, SharedImageBuffer, SharedImagePlacement, SharedState, IMAGE_SHMEM_PATH,
+    IMAGE_SHMEM_PATH_ENV, MAX_IMAGES, SHMEM_PATH, SHMEM_PATH_ENV,
 };
 use shared_memory::{ShmemConf, ShmemError};
 use std::sync::atomic::{AtomicU64, Ordering};
@@ -93,6 +93,17 @@ async fn main() -> Result<()> {
                 shmem_path
             );
             match ShmemConf::new().os_id(&shmem_path).open() {
+                Ok(shmem) if shmem.len() < std::mem::size_of::<SharedState>() => {
+                    // Left behind by a daemon built against an older SharedState layout
+                    eprintln!(
+                        "Existing shared memory at {} is {} bytes, expected at least {}",
+                        shmem_path,
+                        shmem.len(),
+                        std::mem::size_of::<SharedState>()
+                    );
+                    eprintln!("Try cleaning up with: rm -f /dev/shm{}", shmem_path);
+                    anyhow::bail!("Shared memory segment at {} is too small", shmem_path);
+                }
                 Ok(shmem) => {
                     println!("Opened existing shared memory at: {}", shmem_path);
                     shmem
@@ -144,11 +155,13 @@ async fn main() -> Result<()> {
         let state = &mut *shared_ptr;
         let default_bg = 0xFF0D1208u32; // Slime theme background (#0d1208)
         let default_fg = 0xFFA8DF5Au32; // Slime theme foreground (#a8df5a)
-        for cell in state.cells.iter_mut() {
-            cell.bg = default_bg;
-            cell.fg = default_fg;
-            cell.char_codepoint = b' ' as u32;
-        }
+        state.cells.fill(Cell {
+            char_codepoint: b' ' as u32,
+            fg: default_fg,
+            bg: default_bg,
+            flags: 0,
+            _padding: [0; 3],
+        });
     }
 
     let sequence_counter = Arc::new(AtomicU64::new(0));
@@ -226,6 +239,8 @@ async fn main() -> Result<()> {
     };
 
     // Initialize image buffer with zeroed memory
+    // (advise huge pages first so the initial writes fault them in)
+    advise_huge_pages(image_shmem.as_ptr(), image_shmem.len(), &image_shmem_path);
     let image_ptr = image_shmem.as_ptr() as *mut SharedImageBuffer;
     unsafe {
         std::ptr::write_bytes(image_ptr, 0, 1);
@@ -445,6 +460,8 @@ async fn main() -> Result<()> {
                         let did_blit = unsafe { terminal_state.blit_to_shm(shared_ptr, &sequence_counter) };
 
                         if did_blit {
+                            wake_sequence_waiters(shared_ptr);
+
                             // Blit images to SharedImageBuffer
                             blit_images_to_shm(&terminal_state, image_ptr);
 
@@ -473,7 +490,9 @@ async fn main() -> Result<()> {
                         let terminal_state_arc = active_pane.terminal_state();
                         let mut terminal_state = terminal_state_arc.write();
                         // SAFETY: shared_ptr points to valid SharedState in shared memory
-                        unsafe { terminal_state.blit_to_shm(shared_ptr, &sequence_counter) };
+                        if unsafe { terminal_state.blit_to_shm(shared_ptr, &sequence_counter) } {
+                            wake_sequence_waiters(shared_ptr);
+                        }
 
                         // Blit images after resize
                         blit_images_to_shm(&terminal_state, image_ptr);
@@ -570,6 +589,48 @@ fn blit_images_to_shm(state: &TerminalState, image_ptr: *mut SharedImageBuffer)
     }
 }
 
+/// Ask the kernel to back a shared memory mapping with transparent huge pages
+///
+/// Only worth calling for mappings spanning several 2 MB extents (the 16 MB
+/// image buffer); the ~313 KB terminal grid can never hold a PMD-sized page.
+/// `shm_open` segments live on the `/dev/shm` tmpfs mount, so this hint only
+/// takes effect when that mount has `huge=advise` (with `huge=always` it is
+/// redundant, with the default `huge=never` it is ignored). Failure is logged
+/// and otherwise ignored.
+#[cfg(target_os = "linux")]
+fn advise_huge_pages(ptr: *mut u8, len: usize, shmem_path: &str) {
+    // SAFETY: ptr/len describe a live, page-aligned mapping owned by the caller;
+    // MADV_HUGEPAGE does not change its contents.
+    let ret = unsafe { libc::madvise(ptr as *mut libc::c_void, len, libc::MADV_HUGEPAGE) };
+    if ret != 0 {
+        log::debug!(
+            "madvise(MADV_HUGEPAGE) failed for {}: {}",
+            shmem_path,
+            std::io::Error::last_os_error()
+        );
+    }
+}
+
+#[cfg(not(target_os = "linux"))]
+fn advise_huge_pages(_ptr: *mut u8, _len: usize, _shmem_path: &str) {}
+
+/// Wake clients sleeping on the SharedState sequence number
+///
+/// Clients block on the sequence word as a (process-shared) futex instead of
+/// polling it every frame; call this after each published frame.
+#[cfg(target_os = "linux")]
+fn wake_sequence_waiters(shared_ptr: *const SharedState) {
+    // SAFETY: shared_ptr points to the live SharedState mapping. FUTEX_WAKE only
+    // uses the address as a key; it never reads or writes the word.
+    unsafe {
+        let word = (*shared_ptr).sequence_wait_word();
+        libc::syscall(libc::SYS_futex, word, libc::FUTEX_WAKE, i32::MAX);
+    }
+}
+
+#[cfg(not(target_os = "linux"))]
+fn wake_sequence_waiters(_shared_ptr: *const SharedState) {}
+
 /// Write a legible error banner into shared memory so the client/headless modes
 /// can display a readable message even when PTY/SHM setup fails.
 ///
@@ -582,14 +643,17 @@ fn emit_error_grid(shared_ptr: *mut SharedState, sequence_counter: &Arc<AtomicU6
 
     unsafe {
         let state = &mut *shared_ptr;
+        let new_seq = sequence_counter.fetch_add(2, Ordering::SeqCst) + 2;
+        state.begin_write(new_seq);
 
         // Clear
-        for cell in state.cells.iter_mut() {
-            cell.char_codepoint = b' ' as u32;
-            cell.fg = 0xFFFFFFFF;
-            cell.bg = 0xFF000000;
-            cell.flags = 0;
-        }
+        state.cells.fill(Cell {
+            char_codepoint: b' ' as u32,
+            fg: 0xFFFFFFFF,
+            bg: 0xFF000000,
+            flags: 0,
+            _padding: [0; 3],
+        });
 
         for (row, line) in lines.iter().enumerate() {
             for (col, ch) in line.chars().take(GRID_WIDTH).enumerate() {
@@ -602,9 +666,9 @@ fn emit_error_grid(shared_ptr: *mut SharedState, sequence_counter: &Arc<AtomicU6
         state.cursor_y = lines.len().saturating_sub(1) as u16;
         state.dirty_flag = 1;
         state.error_mode = 1; // Signal error mode to clients
-        let new_seq = sequence_counter.fetch_add(1, Ordering::SeqCst) + 1;
-        state.sequence_number = new_seq;
+        state.end_write(new_seq);
     }
+    wake_sequence_waiters(shared_ptr);
     eprintln!("{message}");
 }
 
@@ -16,6 +16,11 @@ use std::sync::Arc;
 use tokio::sync::mpsc;
 use tokio::task::JoinHandle;
 
+/// Size of the per-pane PTY read buffer
+///
+/// Large enough that heavy output (e.g. `cat large.log`) drains in few reads.
+const PTY_READ_BUFFER_SIZE: usize = 64 * 1024;
+
 /// Message types for pane orchestration
 #[derive(Debug)]
 pub enum OrchestratorMessage {
@@ -184,40 +189,65 @@ impl PaneOrchestrator {
             log::debug!("Reader task started for pane {}", pane_id);
         }
 
+        // The cloned PTY reader and the read buffer are kept across iterations and
+        // moved in and out of each blocking read. Cloning the reader dups the master
+        // fd, and a stack buffer returned by value is copied out of the blocking task,
+        // so neither is redone per read; the reader is only re-cloned after EOF/error.
+        let mut reader: Option<Box<dyn Read + Send>> = None;
+        let mut buf = vec![0u8; PTY_READ_BUFFER_SIZE];
+
         loop {
             // Get the PTY master
             let pty_master_arc = pane.pty_master();
 
             // Read from PTY in a blocking task
             let read_result = tokio::task::spawn_blocking({
-                let pty_arc = Arc::clone(&pty_master_arc);
+                let mut reader = reader.take();
+                let mut buf = std::mem::take(&mut buf);
                 move || {
-                    let mut buf = [0u8; 4096];
-                    let pty_lock = match pty_arc.lock() {
-                        Ok(guard) => guard,
-                        Err(poisoned) => {
-                            log::warn!("PTY reader lock poisoned, recovering");
-                            poisoned.into_inner()
-                        }
-                    };
-                    if let Some(ref master) = *pty_lock {
-                        match master.try_clone_reader() {
-                            Ok(mut reader) => reader.read(&mut buf).map(|n| (n, buf)),
-                            Err(e) => Err(std::io::Error::new(
-                                std::io::ErrorKind::Other,
-                                e.to_string(),
-                            )),
+                    if reader.is_none() {
+                        let pty_lock = match pty_master_arc.lock() {
+                            Ok(guard) => guard,
+                            Err(poisoned) => {
+                                log::warn!("PTY reader lock poisoned, recovering");
+                                poisoned.into_inner()
+                            }
+                        };
+                        if let Some(ref master) = *pty_lock {
+                            match master.try_clone_reader() {
+                                Ok(cloned) => reader = Some(cloned),
+                                Err(e) => {
+                                    let err = std::io::Error::new(
+                                        std::io::ErrorKind::Other,
+                                        e.to_string(),
+                                    );
+                                    return (None, buf, Err(err));
+                                }
+                            }
                         }
-                    } else {
-                        // No PTY - signal EOF
-                        Ok((0, buf))
                     }
+
+                    let result = match reader.as_mut() {
+                        Some(reader) => reader.read(&mut buf),
+                        // No PTY - signal EOF
+                        None => Ok(0),
+                    };
+                    (reader, buf, result)
                 }
             })
-            .await;
+            .await
+            .map(|(returned_reader, returned_buf, result)| {
+                buf = returned_buf;
+                // Drop the reader on EOF/error so the next read re-clones it
+                // (the pane's PTY may have been restarted)
+                if matches!(result, Ok(n) if n > 0) {
+                    reader = returned_reader;
+                }
+                result
+            });
 
             match read_result {
-                Ok(Ok((n, buf))) if n > 0 => {
+                Ok(Ok(n)) if n > 0 => {
                     let data = &buf[..n];
 
                     // Process output through the pane's VTE parser
@@ -539,6 +539,54 @@ mod tests {
         assert_eq!(state.cursor_y, 0);
     }
 
+    #[test]
+    fn test_blit_after_shrink_resets_stale_cells() {
+        let (mut state, _terminal, seq) = create_test_terminal();
+        let mut terminal = TerminalState::new(10, 4);
+        let ptr = &mut *state as *mut SharedState;
+        let empty = Cell::default();
+
+        terminal.process_output(b"ABCDEFGH\r\nIJKLMNOP\r\nQRSTUVWX");
+        // SAFETY: ptr points to the boxed SharedState above
+        assert!(unsafe { terminal.blit_to_shm(ptr, &seq) });
+        assert_eq!(state.cells[7].char_codepoint, 'H' as u32);
+        assert_eq!(state.cells[2 * GRID_WIDTH].char_codepoint, 'Q' as u32);
+        // Zeroed memory outside the pane is filled on the first blit
+        assert_eq!(state.cells[10], empty);
+        assert_eq!(state.cells[4 * GRID_WIDTH], empty);
+
+        // Shrink the pane and blit again
+        terminal.resize(5, 2);
+        // SAFETY: ptr points to the boxed SharedState above
+        assert!(unsafe { terminal.blit_to_shm(ptr, &seq) });
+
+        // Rows still inside the pane keep their content
+        let row0: String = state.cells[..5]
+            .iter()
+            .map(|c| char::from_u32(c.char_codepoint).unwrap())
+            .collect();
+        let row1: String = state.cells[GRID_WIDTH..GRID_WIDTH + 5]
+            .iter()
+            .map(|c| char::from_u32(c.char_codepoint).unwrap())
+            .collect();
+        assert_eq!(row0, "ABCDE");
+        assert_eq!(row1, "IJKLM");
+
+        // Columns cut off by the shrink are reset to the empty cell
+        for row in 0..2 {
+            let start = row * GRID_WIDTH;
+            assert!(state.cells[start + 5..start + GRID_WIDTH]
+                .iter()
+                .all(|cell| *cell == empty));
+        }
+
+        // Rows cut off by the shrink are reset to the empty cell
+        assert!(state.cells[2 * GRID_WIDTH..]
+            .iter()
+            .all(|cell| *cell == empty));
+        assert_eq!(state.sequence_number, 4);
+    }
+
     #[test]
     fn test_cursor_bounds_checking() {
         let (_state, mut terminal, _seq) = create_test_terminal();
@@ -554,6 +602,22 @@ mod tests {
         assert!(terminal.cursor_y < rows);
     }
 
+    #[test]
+    fn test_printable_fast_path_skips_osc_payload() {
+        let (_state, mut terminal, _seq) = create_test_terminal();
+
+        // Printable bytes inside an OSC string must not reach the grid
+        terminal.process_output(b"ab\x1b]2;title\x07cd");
+
+        let row: String = (0..4)
+            .map(|x| {
+                char::from_u32(get_grid_cell(&terminal, x, 0).unwrap().char_codepoint).unwrap()
+            })
+            .collect();
+        assert_eq!(row, "abcd");
+        assert_eq!(terminal.cursor_x, 4);
+    }
+
     #[test]
     fn test_large_output_performance() {
         let (_state, mut terminal, _seq) = create_test_terminal();
@@ -181,6 +181,34 @@ impl Grid {
     }
 }
 
+/// Length of the leading run of printable ASCII (0x20..=0x7E) in `data`
+///
+/// Checks 8 bytes per step with SWAR bit tricks, then finishes byte-wise
+/// from the first word that contains a control, DEL or non-ASCII byte.
+#[inline]
+fn printable_ascii_prefix_len(data: &[u8]) -> usize {
+    const LANES: usize = 8;
+    const ONES: u64 = u64::from_ne_bytes([0x01; LANES]);
+    const HIGH: u64 = u64::from_ne_bytes([0x80; LANES]);
+
+    let mut len = 0;
+    for chunk in data.chunks_exact(LANES) {
+        let word = u64::from_ne_bytes(chunk.try_into().unwrap());
+        // High bit set in a lane if that byte is < 0x20, or if byte + 1 >= 0x80
+        let below_space = word.wrapping_sub(ONES * 0x20) & !word & HIGH;
+        let above_tilde = (word.wrapping_add(ONES) | word) & HIGH;
+        if below_space | above_tilde != 0 {
+            break;
+        }
+        len += LANES;
+    }
+
+    len + data[len..]
+        .iter()
+        .take_while(|&&byte| (0x20..0x7F).contains(&byte))
+        .count()
+}
+
 /// Terminal state manager that implements the VTE Perform trait
 ///
 /// Each TerminalState owns its own Grid for off-screen rendering,
@@ -222,6 +250,9 @@ pub struct TerminalState {
     pub zone_tracker: ZoneTracker,
     /// Content changed since last blit - enables reactive updates
     content_changed: bool,
+    /// Parser is known to be in its ground state (set by `print`), so printable
+    /// ASCII can bypass the state machine
+    parser_in_ground: bool,
 }
 
 impl TerminalState {
@@ -250,6 +281,7 @@ impl TerminalState {
             pending_responses: Vec::new(),
             zone_tracker: ZoneTracker::new(500), // Keep last 500 command blocks
             content_changed: true, // Start dirty to ensure initial render
+            parser_in_ground: false,
         }
     }
 
@@ -295,17 +327,16 @@ impl TerminalState {
     /// Blit (copy) the local grid to shared memory if content has changed
     ///
     /// This is called when this pane is active to update the client's view.
-    /// The sequence counter is incremented after writing to signal new data.
+    /// The sequence number goes odd before the grid is written and advances to the
+    /// next even value once the frame is complete.
     ///
     /// Returns `true` if content was blitted, `false` if skipped (no changes).
     ///
     /// # Synchronization
-    /// Uses a simplified approach where sequence increments once per write.
-    /// Clients detect changes by comparing to their last seen sequence.
-    /// Torn reads are theoretically possible but rare at 60fps with atomic Cell writes.
-    ///
-    /// For stricter consistency guarantees, clients can use `SafeSharedState::try_read()`
-    /// which implements full SeqLock validation.
+    /// Writes are bracketed by a seqlock: the sequence number is odd while the grid is
+    /// being written and advances to the next even value once the frame is complete.
+    /// Clients detect changes by comparing to their last seen sequence, and
+    /// `SafeSharedState::try_read()` rejects reads that overlap a write.
     ///
     /// # Safety
     /// The caller must ensure that `shm` is a valid, properly aligned pointer to a
@@ -317,8 +348,12 @@ impl TerminalState {
         }
         let state = &mut *shm;
 
-        // Fill the ENTIRE shared memory grid with theme background color
-        // This ensures areas outside the active terminal area have uniform color
+        // Enter the seqlock write section (sequence goes odd until the frame is published)
+        let new_seq = sequence_counter.fetch_add(2, Ordering::SeqCst) + 2;
+        state.begin_write(new_seq);
+
+        // Theme-colored blank used for shared memory outside the active pane area,
+        // so areas left over from a larger pane are reset to a uniform background
         let empty_cell = Cell {
             char_codepoint: b' ' as u32,
             fg: DEFAULT_FG,
@@ -327,21 +362,30 @@ impl TerminalState {
             _padding: [0; 3],
         };
 
-        // First, fill the entire buffer with empty cells (theme colors)
-        for cell in state.cells.iter_mut() {
-            *cell = empty_cell;
-        }
-
-        // Then copy cells from local grid to shared memory
-        // We need to map from local grid layout to SharedState's fixed GRID_WIDTH layout
-        for y in 0..self.rows.min(GRID_HEIGHT as u16) {
-            for x in 0..self.cols.min(GRID_WIDTH as u16) {
-                let local_idx = y as usize * self.cols as usize + x as usize;
-                let shm_idx = y as usize * GRID_WIDTH + x as usize;
+        // Copy rows from local grid to shared memory, padding each row with empty cells.
+        // We need to map from local grid layout to SharedState's fixed GRID_WIDTH layout.
+        // Each row is contiguous in both layouts, so whole-row slice copies compile to a
+        // vectorized memcpy. Rows that are already up to date are left untouched, so
+        // small edits (cursor moves, a single changed line) only dirty the cache lines
+        // they actually change instead of rewriting the whole grid.
+        let cols = (self.cols as usize).min(GRID_WIDTH);
+        let rows = (self.rows as usize).min(GRID_HEIGHT);
+        let stride = self.cols as usize;
+        for (y, dst_row) in state.cells.chunks_exact_mut(GRID_WIDTH).enumerate() {
+            let src_start = y * stride;
+            let src_end = (src_start + cols).min(self.grid.cells.len());
+            let src: &[Cell] = if y < rows && src_start < src_end {
+                &self.grid.cells[src_start..src_end]
+            } else {
+                &[]
+            };
 
-                if local_idx < self.grid.cells.len() && shm_idx < state.cells.len() {
-                    state.cells[shm_idx] = self.grid.cells[local_idx];
-                }
+            let (dst_active, dst_rest) = dst_row.split_at_mut(src.len());
+            if dst_active != src {
+                dst_active.copy_from_slice(src);
+            }
+            if dst_rest.iter().any(|cell| *cell != empty_cell) {
+                dst_rest.fill(empty_cell);
             }
         }
 
@@ -349,10 +393,9 @@ impl TerminalState {
         state.cursor_x = self.cursor_x;
         state.cursor_y = self.cursor_y;
 
-        // Mark dirty and increment sequence number (signals new data available)
+        // Mark dirty and publish the new sequence number (signals new data available)
         state.dirty_flag = 1;
-        let new_seq = sequence_counter.fetch_add(1, Ordering::SeqCst) + 1;
-        state.sequence_number = new_seq;
+        state.end_write(new_seq);
 
         // Clear the changed flag now that we've blitted
         self.content_changed = false;
@@ -469,8 +512,25 @@ impl TerminalState {
         // Take ownership of the parser temporarily to satisfy borrow checker
         let mut parser = std::mem::replace(&mut self.parser, vte::Parser::new());
 
-        for byte in data {
-            parser.advance(self, *byte);
+        let mut i = 0;
+        while i < data.len() {
+            // Fast path: while the parser sits in its ground state, printable ASCII
+            // would only produce `print` calls, so write runs of it directly.
+            if self.parser_in_ground {
+                let run = printable_ascii_prefix_len(&data[i..]);
+                for &byte in &data[i..i + run] {
+                    self.write_char(byte as char);
+                }
+                i += run;
+                if i == data.len() {
+                    break;
+                }
+            }
+
+            // Anything else goes through the state machine; `print` re-arms the fast path
+            self.parser_in_ground = false;
+            parser.advance(self, data[i]);
+            i += 1;
         }
 
         // Restore the parser
@@ -480,6 +540,19 @@ impl TerminalState {
         self.content_changed = true;
     }
 
+    /// Reference for `process_output` that feeds every byte through the parser
+    ///
+    /// Used by tests to check that the printable ASCII fast path is unobservable.
+    #[cfg(test)]
+    fn process_output_without_fast_path(&mut self, data: &[u8]) {
+        let mut parser = std::mem::replace(&mut self.parser, vte::Parser::new());
+        for &byte in data {
+            parser.advance(self, byte);
+        }
+        self.parser = parser;
+        self.content_changed = true;
+    }
+
     /// Write a character at the current cursor position
     fn write_char(&mut self, c: char) {
         if self.cursor_x >= self.cols {
@@ -685,6 +758,8 @@ impl TerminalState {
 
 impl Perform for TerminalState {
     fn print(&mut self, c: char) {
+        // vte only prints from the ground state
+        self.parser_in_ground = true;
         self.write_char(c);
     }
 
@@ -1112,6 +1187,34 @@ fn color_256_to_rgba(index: u8) -> u32 {
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_printable_fast_path_matches_parser() {
+        // Mix plain ASCII runs with SGR, OSC, DEL, UTF-8 and line controls so the
+        // fast path is entered and left at many different parser states
+        let input = "plain text run \x1b[1;31mred bold\x1b[0m\r\n\
+                     \x1b]0;window title with spaces\x07after title\x7f\r\n\
+                     caf\u{e9} \u{4e16}\u{754c} tail\x1b[2;5Hmoved\x1bPq#0;2;0;0;0\x1b\\done";
+
+        let mut reference = TerminalState::new(80, 24);
+        reference.process_output_without_fast_path(input.as_bytes());
+
+        let mut whole = TerminalState::new(80, 24);
+        whole.process_output(input.as_bytes());
+
+        let mut bytewise = TerminalState::new(80, 24);
+        for byte in input.as_bytes() {
+            bytewise.process_output(std::slice::from_ref(byte));
+        }
+
+        for terminal in [&whole, &bytewise] {
+            assert_eq!(
+                (terminal.cursor_x, terminal.cursor_y),
+                (reference.cursor_x, reference.cursor_y)
+            );
+            assert!(terminal.grid.cells == reference.grid.cells);
+        }
+    }
+
     #[test]
     fn test_ansi_color_conversion() {
         // Slime theme colors
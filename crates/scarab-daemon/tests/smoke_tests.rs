@@ -18,11 +18,12 @@ mod smoke_tests {
         // Create a SharedState on the stack (simulating shared memory)
         let mut state = SharedState {
             sequence_number: 0,
+            _seq_padding: [0; 56],
             dirty_flag: 0,
             error_mode: 0,
             cursor_x: 0,
             cursor_y: 0,
-            _padding2: [0; 2],
+            _padding2: [0; 58],
             cells: [scarab_protocol::Cell::default(); scarab_protocol::BUFFER_SIZE],
         };
 
@@ -494,11 +495,12 @@ mod smoke_tests {
         // Create a SharedState to blit to
         let mut shared_state = SharedState {
             sequence_number: 0,
+            _seq_padding: [0; 56],
             dirty_flag: 0,
             error_mode: 0,
             cursor_x: 0,
             cursor_y: 0,
-            _padding2: [0; 2],
+            _padding2: [0; 58],
             cells: [scarab_protocol::Cell::default(); scarab_protocol::BUFFER_SIZE],
         };
 
@@ -509,7 +511,10 @@ mod smoke_tests {
         unsafe { state.blit_to_shm(&mut shared_state as *mut SharedState, &sequence_counter) };
 
         // Verify shared memory was updated
-        assert_eq!(shared_state.sequence_number, 1, "Sequence should increment");
+        assert_eq!(
+            shared_state.sequence_number, 2,
+            "Sequence should advance to the next even (published) value"
+        );
         assert_eq!(shared_state.dirty_flag, 1, "Dirty flag should be set");
         assert_eq!(shared_state.cursor_x, 0);
         assert_eq!(shared_state.cursor_y, 0);
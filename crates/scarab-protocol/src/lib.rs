@@ -3,6 +3,7 @@
 // It must be #[repr(C)] to ensure memory layout consistency across processes.
 
 use bytemuck::{Pod, Zeroable};
+use core::sync::atomic::{fence, AtomicU64, Ordering};
 
 // Safe abstraction layer for SharedState access
 pub mod terminal_state;
@@ -14,7 +15,7 @@ pub use zones::{CommandBlock, SemanticZone, ZoneTracker, ZoneType};
 
 /// Default shared memory path for terminal state.
 /// Can be overridden via SCARAB_SHMEM_PATH environment variable.
-pub const SHMEM_PATH: &str = "/scarab_shm_v1";
+pub const SHMEM_PATH: &str = "/scarab_shm_v2";
 
 /// Environment variable to override the shared memory path.
 /// Useful for sandboxed environments where /dev/shm is not writable.
@@ -27,7 +28,7 @@ pub const GRID_HEIGHT: usize = 100;
 pub const BUFFER_SIZE: usize = GRID_WIDTH * GRID_HEIGHT;
 
 #[repr(C)]
-#[derive(Copy, Clone, Pod, Zeroable)]
+#[derive(Copy, Clone, PartialEq, Eq, Pod, Zeroable)]
 pub struct Cell {
     pub char_codepoint: u32,
     pub fg: u32,           // RGBA
@@ -48,16 +49,24 @@ impl Default for Cell {
     }
 }
 
+/// Size of a CPU cache line on the platforms we target
+pub const CACHE_LINE_SIZE: usize = 64;
+
 // A double-buffered grid state living in shared memory
-#[repr(C)]
+//
+// The header is split across two cache lines: the seqlock word sits alone on the
+// first so cursor/flag updates never invalidate the reader's copy of it, and the
+// cell grid starts on a cache-line boundary.
+#[repr(C, align(64))]
 #[derive(Copy, Clone)]
 pub struct SharedState {
-    pub sequence_number: u64, // Atomic sequence for synchronization
+    pub sequence_number: u64, // Seqlock sequence: odd while a write is in progress
+    pub _seq_padding: [u8; 56], // Keep the sequence on its own cache line
     pub dirty_flag: u8,
     pub error_mode: u8, // 0 = normal mode, 1 = error mode (PTY/SHM unavailable)
     pub cursor_x: u16,
     pub cursor_y: u16,
-    pub _padding2: [u8; 2], // Align to u64 boundary for cells array
+    pub _padding2: [u8; 58], // Pad header to a full cache line before cells array
     // Fixed size buffer for the "visible" screen.
     // In production, use offset pointers to a larger ring buffer.
     pub cells: [Cell; BUFFER_SIZE],
@@ -67,6 +76,70 @@ pub struct SharedState {
 unsafe impl Pod for SharedState {}
 unsafe impl Zeroable for SharedState {}
 
+// Pod requires no implicit padding: two header cache lines followed by the grid
+const _: () = assert!(
+    core::mem::size_of::<SharedState>()
+        == 2 * CACHE_LINE_SIZE + BUFFER_SIZE * core::mem::size_of::<Cell>()
+);
+
+// Seqlock protocol for SharedState
+//
+// The writer moves `sequence_number` to an odd value before touching the grid
+// and to the next even value once the frame is complete. Readers never block:
+// they retry (or skip the frame) when they observe an odd value or when the
+// sequence changed while they were copying.
+impl SharedState {
+    /// Load the sequence number with Acquire ordering
+    #[inline]
+    pub fn load_sequence(&self) -> u64 {
+        // SAFETY: `sequence_number` is 8-byte aligned (first field of a #[repr(C)]
+        // struct) and AtomicU64 has the same in-memory representation as u64. The
+        // atomic view is only used to load, never to store through `&self`.
+        let sequence =
+            unsafe { AtomicU64::from_ptr(core::ptr::addr_of!(self.sequence_number) as *mut u64) };
+        sequence.load(Ordering::Acquire)
+    }
+
+    /// Atomic view of `sequence_number` for the writer
+    #[inline]
+    fn sequence_atomic_mut(&mut self) -> &AtomicU64 {
+        // SAFETY: same alignment/representation argument as `load_sequence`; the
+        // pointer comes from `&mut self`, so storing through it is permitted.
+        unsafe { AtomicU64::from_ptr(core::ptr::addr_of_mut!(self.sequence_number)) }
+    }
+
+    /// Begin a write section that will be published as `seq`
+    ///
+    /// `seq` must be even. Readers observe `seq - 1` (odd) until
+    /// [`SharedState::end_write`] is called with the same value.
+    #[inline]
+    pub fn begin_write(&mut self, seq: u64) {
+        debug_assert!(seq & 1 == 0, "published sequence numbers must be even");
+        self.sequence_atomic_mut().store(seq - 1, Ordering::Relaxed);
+        fence(Ordering::Release);
+    }
+
+    /// Publish the frame started by [`SharedState::begin_write`]
+    #[inline]
+    pub fn end_write(&mut self, seq: u64) {
+        self.sequence_atomic_mut().store(seq, Ordering::Release);
+    }
+
+    /// Address of the low 32 bits of `sequence_number`
+    ///
+    /// Futexes operate on 32-bit words. The low half changes on every write, so
+    /// clients can sleep on it and the daemon wakes them after publishing a frame.
+    #[inline]
+    pub fn sequence_wait_word(&self) -> *const u32 {
+        let word = core::ptr::addr_of!(self.sequence_number) as *const u32;
+        if cfg!(target_endian = "big") {
+            word.wrapping_add(1)
+        } else {
+            word
+        }
+    }
+}
+
 // Image buffer constants
 /// Maximum number of concurrent image placements
 pub const MAX_IMAGES: usize = 64;
@@ -961,3 +1034,43 @@ impl PromptMarkerInfo {
 }
 
 extern crate alloc;
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use alloc::boxed::Box;
+
+    #[test]
+    fn test_seqlock_begin_write_leaves_sequence_odd() {
+        let mut state = Box::new(SharedState::zeroed());
+
+        state.begin_write(2);
+        assert_eq!(state.load_sequence(), 1);
+
+        state.end_write(2);
+        assert_eq!(state.load_sequence(), 2);
+    }
+
+    #[test]
+    fn test_seqlock_consecutive_frames() {
+        let mut state = Box::new(SharedState::zeroed());
+
+        for seq in (2..=10).step_by(2) {
+            state.begin_write(seq);
+            assert_eq!(state.load_sequence() & 1, 1);
+            state.end_write(seq);
+            assert_eq!(state.load_sequence(), seq);
+        }
+    }
+
+    #[test]
+    fn test_sequence_wait_word_is_low_half() {
+        let mut state = Box::new(SharedState::zeroed());
+        state.begin_write(0x1_0000_0002);
+        state.end_write(0x1_0000_0002);
+
+        // SAFETY: the wait word points into `state`, which is live and aligned
+        let word = unsafe { *state.sequence_wait_word() };
+        assert_eq!(word, 2);
+    }
+}